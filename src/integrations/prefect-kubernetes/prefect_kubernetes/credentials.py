@@ -1,9 +1,28 @@
 """Module for defining Kubernetes credential handling and client generation."""
 
-from contextlib import contextmanager
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from io import BufferedReader
 from pathlib import Path
-from typing import Dict, Generator, Optional, Type, Union
+from typing import (
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+from weakref import WeakValueDictionary
 
+import orjson
 import yaml
 from kubernetes import config
 from kubernetes.client import (
@@ -15,6 +34,7 @@ from kubernetes.client import (
     CustomObjectsApi,
 )
 from kubernetes.config.config_exception import ConfigException
+from kubernetes.config.incluster_config import SERVICE_HOST_ENV_NAME
 from pydantic import Field, field_validator
 from typing_extensions import Literal, Self
 
@@ -30,6 +50,248 @@ K8S_CLIENT_TYPES = {
     "custom_objects": CustomObjectsApi,
 }
 
+_VALID_CLIENT_TYPES_REPR = listrepr(K8S_CLIENT_TYPES.keys())
+
+# Prefer the libyaml-backed loader when PyYAML was built against it; it is
+# considerably faster than the pure-Python parser for large kubeconfig files.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Resource-specific clients keyed by the `ApiClient` they wrap and their type. Each
+# client holds a reference to its `ApiClient`, so the id cannot be reused while
+# the entry is alive.
+_RESOURCE_CLIENT_CACHE: "WeakValueDictionary[Tuple[int, str], KubernetesClient]" = (
+    WeakValueDictionary()
+)
+
+
+def _parse_kubeconfig(contents: str):
+    """
+    Parse the contents of a kubeconfig file.
+
+    Kubeconfig files are sometimes serialized as JSON, which is also valid YAML.
+    JSON documents are parsed with the much faster JSON parser, falling back to
+    the YAML parser if that fails.
+    """
+    if contents.lstrip().startswith("{"):
+        try:
+            return json.loads(contents)
+        except json.JSONDecodeError:
+            pass
+    return yaml.load(contents, Loader=_YAML_LOADER)
+
+
+def _parse_kubeconfig_file(file: BufferedReader):
+    """
+    Parse a kubeconfig file from an open binary file handle.
+
+    YAML is streamed from the file, which avoids holding a decoded copy of the
+    entire file in memory alongside the parser's buffers. JSON documents are read
+    into memory in full before parsing.
+    """
+    if file.peek(1).lstrip().startswith(b"{"):
+        try:
+            return json.load(file)
+        except ValueError:
+            file.seek(0)
+    return yaml.load(file, Loader=_YAML_LOADER)
+
+
+class _CachedKubeconfig:
+    """
+    The parsed contents of a kubeconfig file along with its context names and
+    current context name.
+    """
+
+    __slots__ = ("config_dict", "context_names", "current_context")
+
+    def __init__(
+        self,
+        config_dict: Dict,
+        context_names: FrozenSet[str],
+        current_context: Optional[str],
+    ):
+        self.config_dict = config_dict
+        self.context_names = context_names
+        self.current_context = current_context
+
+
+@lru_cache(maxsize=8)
+def _load_kubeconfig(path: str, mtime_ns: int, size: int) -> _CachedKubeconfig:
+    """
+    Load the full contents, context names, and current context name of a
+    kubeconfig file. The file is read and parsed once.
+
+    The modification time and size of the file are part of the cache key so that
+    changes to the file on disk invalidate the cached result.
+    """
+    with open(path, "rb") as file:
+        config_dict = _parse_kubeconfig_file(file)
+    if not config_dict:
+        raise ConfigException("Invalid kube-config file. No configuration found.")
+
+    context_names = frozenset(
+        context["name"] for context in config_dict.get("contexts") or []
+    )
+    return _CachedKubeconfig(
+        config_dict, context_names, config_dict.get("current-context")
+    )
+
+
+def _fingerprint(config_dict: Dict, context_name: str) -> str:
+    """
+    Compute a stable identifier for a kubeconfig and the context used from it.
+    """
+    serialized = orjson.dumps(
+        config_dict,
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    )
+    return hashlib.sha256(serialized + context_name.encode()).hexdigest()
+
+
+def _close_client(api_client: ApiClient) -> None:
+    """
+    Close a client's open connections and its thread pool.
+    """
+    api_client.rest_client.pool_manager.clear()
+    api_client.close()
+
+
+class _PooledClient:
+    """
+    An idle `ApiClient` in the pool and when it was last returned.
+    """
+
+    __slots__ = ("api_client", "last_used")
+
+    def __init__(self, api_client: ApiClient, last_used: float):
+        self.api_client = api_client
+        self.last_used = last_used
+
+
+class _ApiClientPool:
+    """
+    A bounded, thread-safe pool of `ApiClient`s keyed by cluster config
+    fingerprint.
+
+    Clients are checked out for exclusive use and returned to the pool once the
+    caller is done with them so that later callers can reuse their open
+    connections. Several idle clients may be kept for the same key so that
+    concurrent callers can each reuse one. When more than `max_size` clients are
+    idle, the oldest client of the least recently returned key is closed, and
+    clients left idle for longer than `idle_ttl` seconds are closed the next time
+    the pool is used.
+    """
+
+    def __init__(self, max_size: int = 8, idle_ttl: float = 30.0):
+        self._max_size = max_size
+        self._idle_ttl = idle_ttl
+        self._lock = threading.Lock()
+        self._clients: "OrderedDict[str, List[_PooledClient]]" = OrderedDict()
+        self._size = 0
+
+    def checkout(self, key: str) -> Optional[ApiClient]:
+        """
+        Take the most recently returned client for `key`, if there is one.
+        """
+        with self._lock:
+            stale = self._pop_expired(time.monotonic())
+            entries = self._clients.get(key)
+            entry = None
+            if entries:
+                entry = entries.pop()
+                self._size -= 1
+                if not entries:
+                    del self._clients[key]
+
+        for api_client in stale:
+            _close_client(api_client)
+
+        return entry.api_client if entry is not None else None
+
+    def checkin(self, key: str, api_client: ApiClient) -> None:
+        """
+        Return a client to the pool, closing any clients it evicts.
+        """
+        now = time.monotonic()
+        with self._lock:
+            stale = self._pop_expired(now)
+            self._clients.setdefault(key, []).append(_PooledClient(api_client, now))
+            self._clients.move_to_end(key)
+            self._size += 1
+            while self._size > self._max_size:
+                oldest_key, entries = next(iter(self._clients.items()))
+                stale.append(entries.pop(0).api_client)
+                self._size -= 1
+                if not entries:
+                    del self._clients[oldest_key]
+
+        for stale_client in stale:
+            _close_client(stale_client)
+
+    def _pop_expired(self, now: float) -> List[ApiClient]:
+        expired = []
+        for key in list(self._clients):
+            entries = self._clients[key]
+            active = [
+                entry for entry in entries if now - entry.last_used <= self._idle_ttl
+            ]
+            if len(active) == len(entries):
+                continue
+            expired.extend(
+                entry.api_client
+                for entry in entries
+                if now - entry.last_used > self._idle_ttl
+            )
+            if active:
+                self._clients[key] = active
+            else:
+                del self._clients[key]
+        self._size -= len(expired)
+        return expired
+
+
+# Upper bound on the clients and configurations kept for reuse
+_MAX_CACHED_CLUSTER_CONFIGS = 8
+
+_API_CLIENT_POOL = _ApiClientPool(max_size=_MAX_CACHED_CLUSTER_CONFIGS)
+
+# Client configurations materialized from a kubeconfig, keyed by fingerprint and
+# ordered from least to most recently used
+_CONFIGURATION_CACHE: "OrderedDict[str, Configuration]" = OrderedDict()
+_CONFIGURATION_CACHE_LOCK = threading.Lock()
+
+# Serializes `KubernetesClusterConfig.configure_client` so that the recorded
+# active config always matches the default configuration that it installed
+_CONFIGURE_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client_configuration(
+    cluster_config: "KubernetesClusterConfig", fingerprint: str
+) -> Configuration:
+    """
+    Return a copy of the client configuration for a cluster config, only running
+    the kubeconfig loader the first time a given config is seen.
+    """
+    with _CONFIGURATION_CACHE_LOCK:
+        cached = _CONFIGURATION_CACHE.get(fingerprint)
+        if cached is not None:
+            _CONFIGURATION_CACHE.move_to_end(fingerprint)
+
+    if cached is None:
+        cached = Configuration()
+        config.kube_config.load_kube_config_from_dict(
+            config_dict=cluster_config.config,
+            context=cluster_config.context_name,
+            client_configuration=cached,
+        )
+        with _CONFIGURATION_CACHE_LOCK:
+            _CONFIGURATION_CACHE[fingerprint] = cached
+            while len(_CONFIGURATION_CACHE) > _MAX_CACHED_CLUSTER_CONFIGS:
+                _CONFIGURATION_CACHE.popitem(last=False)
+
+    return copy.deepcopy(cached)
+
 
 class KubernetesClusterConfig(Block):
     """
@@ -60,11 +322,16 @@ class KubernetesClusterConfig(Block):
         default=..., description="The name of the kubectl context to use."
     )
 
+    # Fingerprint of the cluster config most recently activated by
+    # `configure_client` and the default client configuration it installed
+    _active_fingerprint: ClassVar[Optional[str]] = None
+    _active_default: ClassVar[Optional[Configuration]] = None
+
     @field_validator("config", mode="before")
     @classmethod
     def parse_yaml_config(cls, value):
         if isinstance(value, str):
-            return yaml.safe_load(value)
+            return _parse_kubeconfig(value)
         return value
 
     @classmethod
@@ -83,26 +350,29 @@ class KubernetesClusterConfig(Block):
         path = Path(path or config.kube_config.KUBE_CONFIG_DEFAULT_LOCATION)
         path = path.expanduser().resolve()
 
+        stat = path.stat()
+        kubeconfig = _load_kubeconfig(str(path), stat.st_mtime_ns, stat.st_size)
+
         # Determine the context
-        (
-            existing_contexts,
-            current_context,
-        ) = config.kube_config.list_kube_config_contexts(config_file=str(path))
-        context_names = {ctx["name"] for ctx in existing_contexts}
         if context_name:
-            if context_name not in context_names:
+            if context_name not in kubeconfig.context_names:
                 raise ValueError(
-                    f"Context {context_name!r} not found. "
-                    f"Specify one of: {listrepr(context_names, sep=', ')}."
+                    f"Context {context_name!r} not found. Specify one of: "
+                    f"{listrepr(kubeconfig.context_names, sep=', ')}."
                 )
         else:
-            context_name = current_context["name"]
-
-        # Load the entire config file
-        config_file_contents = path.read_text()
-        config_dict = yaml.safe_load(config_file_contents)
+            if kubeconfig.current_context not in kubeconfig.context_names:
+                raise ConfigException(
+                    "Invalid kube-config file. "
+                    f"Expected a valid current-context in '{path}'."
+                )
+            context_name = kubeconfig.current_context
 
-        return cls(config=config_dict, context_name=context_name)
+        # Copy the cached config so that changes to this block do not leak into
+        # later loads of the same file
+        return cls(
+            config=copy.deepcopy(kubeconfig.config_dict), context_name=context_name
+        )
 
     def get_api_client(self) -> "ApiClient":
         """
@@ -117,10 +387,99 @@ class KubernetesClusterConfig(Block):
         Activates this cluster configuration by loading the configuration into the
         Kubernetes Python client. After calling this, Kubernetes API clients can use
         this config's context.
+
+        Activating the cluster configuration that is already active is a no-op, as
+        long as the default client configuration it installed has not since been
+        replaced, e.g. by `kubernetes.config.load_incluster_config`.
         """
-        config.kube_config.load_kube_config_from_dict(
-            config_dict=self.config, context=self.context_name
-        )
+        fingerprint = _fingerprint(self.config, self.context_name)
+        with _CONFIGURE_CLIENT_LOCK:
+            if (
+                fingerprint == KubernetesClusterConfig._active_fingerprint
+                and Configuration._default is KubernetesClusterConfig._active_default
+            ):
+                return
+
+            config.kube_config.load_kube_config_from_dict(
+                config_dict=self.config, context=self.context_name
+            )
+            KubernetesClusterConfig._active_fingerprint = fingerprint
+            KubernetesClusterConfig._active_default = Configuration._default
+
+
+class _KubernetesClientContext:
+    """
+    Context manager returned by `KubernetesCredentials.get_client`. Entering it
+    yields a resource-specific client; exiting it releases the underlying
+    `ApiClient`.
+    """
+
+    def __init__(
+        self,
+        credentials: "KubernetesCredentials",
+        client_type: str,
+        configuration: Optional[Configuration],
+    ):
+        self._credentials = credentials
+        self._client_type = client_type
+        self._configuration = configuration
+        self._pool_key: Optional[str] = None
+        self._api_client: Optional[ApiClient] = None
+
+    def __enter__(self) -> KubernetesClient:
+        cluster_config = self._credentials.cluster_config
+        if cluster_config and self._configuration is None:
+            # Reuse a client, and its open connections, for this cluster config
+            self._pool_key = _fingerprint(
+                cluster_config.config, cluster_config.context_name
+            )
+            self._api_client = _API_CLIENT_POOL.checkout(self._pool_key)
+            if self._api_client is None:
+                self._api_client = ApiClient(
+                    configuration=_get_client_configuration(
+                        cluster_config, self._pool_key
+                    )
+                )
+        else:
+            self._pool_key = None
+            client_config = self._configuration or Configuration()
+            self._load_configuration(client_config)
+            self._api_client = ApiClient(configuration=client_config)
+
+        try:
+            return self._credentials.get_resource_specific_client(
+                self._client_type, api_client=self._api_client
+            )
+        except BaseException:
+            self._release()
+            raise
+
+    def __exit__(self, *exc_info) -> None:
+        self._release()
+
+    def _load_configuration(self, client_config: Configuration) -> None:
+        cluster_config = self._credentials.cluster_config
+        if cluster_config:
+            config.kube_config.load_kube_config_from_dict(
+                config_dict=cluster_config.config,
+                context=cluster_config.context_name,
+                client_configuration=client_config,
+            )
+        elif os.environ.get(SERVICE_HOST_ENV_NAME):
+            try:
+                config.load_incluster_config(client_configuration=client_config)
+            except ConfigException:
+                config.load_kube_config(client_configuration=client_config)
+        else:
+            config.load_kube_config(client_configuration=client_config)
+
+    def _release(self) -> None:
+        if self._pool_key is not None:
+            _API_CLIENT_POOL.checkin(self._pool_key, self._api_client)
+        else:
+            _close_client(self._api_client)
+        self._pool_key = None
+        self._api_client = None
 
 
 class KubernetesCredentials(Block):
@@ -145,19 +504,30 @@ class KubernetesCredentials(Block):
 
     cluster_config: Optional[KubernetesClusterConfig] = None
 
-    @contextmanager
     def get_client(
         self,
         client_type: Literal["apps", "batch", "core", "custom_objects"],
         configuration: Optional[Configuration] = None,
-    ) -> Generator[KubernetesClient, None, None]:
+    ) -> "_KubernetesClientContext":
         """Convenience method for retrieving a Kubernetes API client for deployment resources.
 
+        The client is configured from the first of the following that succeeds:
+
+        1. The `cluster_config` of this block, if set.
+
+        2. In-cluster configuration (will only work when running on a pod, so it is
+        skipped if `KUBERNETES_SERVICE_HOST` is not set).
+
+        3. The kube config file in its default location.
+
         Args:
             client_type: The resource-specific type of Kubernetes client to retrieve.
+            configuration: The client configuration to load into. If not provided,
+                clients for a `cluster_config` are pooled and reused.
 
-        Yields:
-            An authenticated, resource-specific Kubernetes API client.
+        Returns:
+            A context manager yielding an authenticated, resource-specific
+            Kubernetes API client.
 
         Example:
             ```python
@@ -168,36 +538,26 @@ class KubernetesCredentials(Block):
                     print(pod.metadata.name)
             ```
         """
-        client_config = configuration or Configuration()
-
-        with ApiClient(configuration=client_config) as generic_client:
-            try:
-                yield self.get_resource_specific_client(client_type)
-            finally:
-                generic_client.rest_client.pool_manager.clear()
+        return _KubernetesClientContext(self, client_type, configuration)
 
     def get_resource_specific_client(
         self,
         client_type: str,
+        api_client: Optional[ApiClient] = None,
     ) -> Union[AppsV1Api, BatchV1Api, CoreV1Api]:
         """
-        Utility function for configuring a generic Kubernetes client.
-        It will attempt to connect to a Kubernetes cluster in three steps with
-        the first successful connection attempt becoming the mode of communication with
-        a cluster:
-
-        1. It will first attempt to use a `KubernetesCredentials` block's
-        `cluster_config` to configure a client using
-        `KubernetesClusterConfig.configure_client`.
+        Utility function for wrapping a configured generic Kubernetes client in a
+        resource-specific client. The resource-specific client is reused across
+        calls with the same `ApiClient`.
 
-        2. Attempt in-cluster connection (will only work when running on a pod).
-
-        3. Attempt out-of-cluster connection using the default location for a
-        kube config file.
+        This does not load any configuration; use `get_client` for a client
+        configured from this block.
 
         Args:
             client_type: The Kubernetes API client type for interacting with specific
                 Kubernetes resources.
+            api_client: The configured generic `ApiClient` to wrap. Defaults to a
+                new client using the Kubernetes client's default configuration.
 
         Returns:
             KubernetesClient: An authenticated, resource-specific Kubernetes Client.
@@ -205,19 +565,19 @@ class KubernetesCredentials(Block):
         Raises:
             ValueError: If `client_type` is not a valid Kubernetes API client type.
         """
-
-        if self.cluster_config:
-            self.cluster_config.configure_client()
-        else:
-            try:
-                config.load_incluster_config()
-            except ConfigException:
-                config.load_kube_config()
-
-        try:
-            return K8S_CLIENT_TYPES[client_type]()
-        except KeyError:
+        if api_client is not None:
+            key = (id(api_client), client_type)
+            client = _RESOURCE_CLIENT_CACHE.get(key)
+            if client is not None:
+                return client
+
+        client_class = K8S_CLIENT_TYPES.get(client_type)
+        if client_class is None:
             raise ValueError(
                 f"Invalid client type provided '{client_type}'."
-                f" Must be one of {listrepr(K8S_CLIENT_TYPES.keys())}."
+                f" Must be one of {_VALID_CLIENT_TYPES_REPR}."
             )
+        client = client_class(api_client)
+        if api_client is not None:
+            _RESOURCE_CLIENT_CACHE[key] = client
+        return client
@@ -1,19 +1,35 @@
 import base64
+import json
+import threading
 from pathlib import Path
 from typing import Dict
+from unittest.mock import MagicMock
 
 import pydantic
 import pytest
 import yaml
+from kubernetes import config
 from kubernetes.client import (
     ApiClient,
     AppsV1Api,
     BatchV1Api,
+    Configuration,
     CoreV1Api,
     CustomObjectsApi,
 )
+from kubernetes.config.config_exception import ConfigException
 from kubernetes.config.kube_config import list_kube_config_contexts
-from prefect_kubernetes.credentials import KubernetesClusterConfig
+from prefect_kubernetes.credentials import (
+    _CONFIGURATION_CACHE,
+    _MAX_CACHED_CLUSTER_CONFIGS,
+    K8S_CLIENT_TYPES,
+    KubernetesClusterConfig,
+    KubernetesCredentials,
+    _ApiClientPool,
+    _fingerprint,
+    _get_client_configuration,
+    _load_kubeconfig,
+)
 
 sample_base64_string = base64.b64encode(b"hello marvin from the other side")
 
@@ -63,6 +79,188 @@ def test_client_return_type(kubernetes_credentials, resource_type, client_type):
         assert isinstance(client, client_type)
 
 
+def test_get_client_reuses_pooled_api_client(kubernetes_credentials):
+    with kubernetes_credentials.get_client("core") as first:
+        pass
+    with kubernetes_credentials.get_client("batch") as second:
+        pass
+
+    assert first.api_client is second.api_client
+
+
+def test_get_client_does_not_share_checked_out_api_client(kubernetes_credentials):
+    with kubernetes_credentials.get_client("core") as outer:
+        with kubernetes_credentials.get_client("core") as inner:
+            assert outer.api_client is not inner.api_client
+
+
+class TestApiClientPool:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = MagicMock(return_value=0.0)
+        monkeypatch.setattr(
+            "prefect_kubernetes.credentials.time", MagicMock(monotonic=clock)
+        )
+        return clock
+
+    @staticmethod
+    def fake_client():
+        return MagicMock()
+
+    @staticmethod
+    def assert_closed(api_client):
+        api_client.rest_client.pool_manager.clear.assert_called_once()
+        api_client.close.assert_called_once()
+
+    def test_reuses_returned_client(self, clock):
+        pool = _ApiClientPool()
+        api_client = self.fake_client()
+        pool.checkin("a", api_client)
+
+        assert pool.checkout("b") is None
+        assert pool.checkout("a") is api_client
+        assert pool.checkout("a") is None
+        api_client.close.assert_not_called()
+
+    def test_keeps_concurrently_returned_clients(self, clock):
+        pool = _ApiClientPool()
+        first, second = self.fake_client(), self.fake_client()
+        pool.checkin("a", first)
+        pool.checkin("a", second)
+
+        assert {pool.checkout("a"), pool.checkout("a")} == {first, second}
+        first.close.assert_not_called()
+        second.close.assert_not_called()
+
+    def test_evicts_oldest_client_when_full(self, clock):
+        pool = _ApiClientPool(max_size=2)
+        oldest, newer, newest = (self.fake_client() for _ in range(3))
+        pool.checkin("a", oldest)
+        pool.checkin("b", newer)
+        pool.checkin("c", newest)
+
+        self.assert_closed(oldest)
+        assert pool.checkout("a") is None
+        assert pool.checkout("b") is newer
+        assert pool.checkout("c") is newest
+
+    def test_closes_idle_clients_after_ttl(self, clock):
+        pool = _ApiClientPool(idle_ttl=30.0)
+        idle, recent = self.fake_client(), self.fake_client()
+        pool.checkin("a", idle)
+        clock.return_value = 20.0
+        pool.checkin("b", recent)
+
+        clock.return_value = 31.0
+        assert pool.checkout("a") is None
+        self.assert_closed(idle)
+        assert pool.checkout("b") is recent
+        recent.close.assert_not_called()
+
+
+def test_client_configuration_is_cached(kubernetes_credentials, monkeypatch):
+    cluster_config = kubernetes_credentials.cluster_config
+    fingerprint = _fingerprint(cluster_config.config, cluster_config.context_name)
+    first = _get_client_configuration(cluster_config, fingerprint)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("kubeconfig should not be loaded again")
+
+    monkeypatch.setattr(
+        "prefect_kubernetes.credentials.config.kube_config.load_kube_config_from_dict",
+        fail,
+    )
+    second = _get_client_configuration(cluster_config, fingerprint)
+
+    assert first is not second
+    assert first.host == second.host == "https://localhost:9443"
+
+
+def test_client_configuration_copies_are_independent(kubernetes_credentials):
+    cluster_config = kubernetes_credentials.cluster_config
+    fingerprint = _fingerprint(cluster_config.config, cluster_config.context_name)
+
+    first = _get_client_configuration(cluster_config, fingerprint)
+    first.api_key["authorization"] = "Bearer changed"
+    second = _get_client_configuration(cluster_config, fingerprint)
+
+    assert second.api_key["authorization"] == "Bearer testtoken"
+
+
+def test_client_configuration_cache_is_bounded(kubernetes_credentials, monkeypatch):
+    monkeypatch.setattr(
+        "prefect_kubernetes.credentials.config.kube_config.load_kube_config_from_dict",
+        MagicMock(),
+    )
+    cluster_config = kubernetes_credentials.cluster_config
+    fingerprints = [f"fingerprint-{i}" for i in range(_MAX_CACHED_CLUSTER_CONFIGS + 1)]
+
+    for fingerprint in fingerprints:
+        _get_client_configuration(cluster_config, fingerprint)
+
+    assert len(_CONFIGURATION_CACHE) == _MAX_CACHED_CLUSTER_CONFIGS
+    assert fingerprints[0] not in _CONFIGURATION_CACHE
+    assert fingerprints[-1] in _CONFIGURATION_CACHE
+
+
+def test_resource_specific_client_is_reused_per_api_client(kubernetes_credentials):
+    api_client = ApiClient()
+
+    first = kubernetes_credentials.get_resource_specific_client(
+        "core", api_client=api_client
+    )
+    second = kubernetes_credentials.get_resource_specific_client(
+        "core", api_client=api_client
+    )
+
+    assert first is second
+    assert first.api_client is api_client
+    assert (
+        kubernetes_credentials.get_resource_specific_client(
+            "core", api_client=ApiClient()
+        )
+        is not first
+    )
+
+
+def test_get_client_skips_incluster_config_outside_cluster(
+    monkeypatch,
+):
+    monkeypatch.delenv("KUBERNETES_SERVICE_HOST", raising=False)
+    load_incluster_config = MagicMock()
+    load_kube_config = MagicMock()
+    monkeypatch.setattr(
+        "prefect_kubernetes.credentials.config.load_incluster_config",
+        load_incluster_config,
+    )
+    monkeypatch.setattr(
+        "prefect_kubernetes.credentials.config.load_kube_config", load_kube_config
+    )
+
+    with KubernetesCredentials().get_client("core"):
+        pass
+
+    load_incluster_config.assert_not_called()
+    load_kube_config.assert_called_once()
+
+
+@pytest.mark.parametrize("client_type", K8S_CLIENT_TYPES)
+def test_resource_specific_client_matches_client_types(
+    kubernetes_credentials, client_type
+):
+    client = kubernetes_credentials.get_resource_specific_client(
+        client_type, api_client=ApiClient()
+    )
+    assert type(client) is K8S_CLIENT_TYPES[client_type]
+
+
+def test_resource_specific_client_without_api_client(kubernetes_credentials):
+    client = kubernetes_credentials.get_resource_specific_client("core")
+
+    assert isinstance(client, CoreV1Api)
+    assert isinstance(client.api_client, ApiClient)
+
+
 def test_client_bad_resource_type(kubernetes_credentials):
     with pytest.raises(
         ValueError, match="Invalid client type provided 'shoo-ba-daba-doo'"
@@ -82,6 +280,63 @@ async def test_instantiation_from_file(config_file):
     assert cluster_config.context_name == "docker-desktop"
 
 
+async def test_instantiation_from_json_file(tmp_path):
+    config_file = tmp_path / "kube_config.json"
+    config_file.write_text(json.dumps(yaml.safe_load(CONFIG_CONTENT)))
+
+    cluster_config = KubernetesClusterConfig.from_file(path=config_file)
+
+    assert cluster_config.config == yaml.safe_load(CONFIG_CONTENT)
+    assert cluster_config.context_name == "docker-desktop"
+
+
+async def test_instantiation_from_file_is_cached(config_file):
+    _load_kubeconfig.cache_clear()
+
+    first = KubernetesClusterConfig.from_file(path=config_file)
+    second = KubernetesClusterConfig.from_file(path=config_file)
+
+    assert _load_kubeconfig.cache_info().hits == 1
+    assert first.config == second.config
+    assert first.config is not second.config
+
+
+async def test_instantiation_from_file_reloads_changed_file(config_file):
+    KubernetesClusterConfig.from_file(path=config_file)
+
+    updated_config = yaml.safe_load(CONFIG_CONTENT)
+    updated_config["contexts"].append(
+        {
+            "context": {"cluster": "docker-desktop", "user": "docker-desktop"},
+            "name": "other-desktop",
+        }
+    )
+    updated_config["current-context"] = "other-desktop"
+    config_file.write_text(yaml.safe_dump(updated_config))
+
+    cluster_config = KubernetesClusterConfig.from_file(path=config_file)
+    assert cluster_config.context_name == "other-desktop"
+
+
+async def test_instantiation_from_relative_path_follows_cwd(tmp_path, monkeypatch):
+    for directory, context_name in (("a", "docker-desktop"), ("b", "other-desktop")):
+        config_dict = yaml.safe_load(CONFIG_CONTENT)
+        config_dict["contexts"][0]["name"] = context_name
+        config_dict["current-context"] = context_name
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "config").write_text(yaml.safe_dump(config_dict))
+
+    monkeypatch.chdir(tmp_path / "a")
+    assert KubernetesClusterConfig.from_file(path="config").context_name == (
+        "docker-desktop"
+    )
+
+    monkeypatch.chdir(tmp_path / "b")
+    assert KubernetesClusterConfig.from_file(path="config").context_name == (
+        "other-desktop"
+    )
+
+
 async def test_instantiation_from_dict(config_file):
     cluster_config = KubernetesClusterConfig(
         config=yaml.safe_load(CONFIG_CONTENT), context_name="docker-desktop"
@@ -123,6 +378,20 @@ async def test_instantiation_from_file_with_unknown_context_name(config_file):
         )
 
 
+async def test_instantiation_from_file_without_current_context(config_file):
+    config_dict = yaml.safe_load(CONFIG_CONTENT)
+    del config_dict["current-context"]
+    config_file.write_text(yaml.safe_dump(config_dict))
+
+    with pytest.raises(ConfigException, match="Expected a valid current-context"):
+        KubernetesClusterConfig.from_file(path=config_file)
+
+    cluster_config = KubernetesClusterConfig.from_file(
+        path=config_file, context_name="docker-desktop"
+    )
+    assert cluster_config.context_name == "docker-desktop"
+
+
 async def test_get_api_client(config_file):
     cluster_config = KubernetesClusterConfig.from_file(path=config_file)
     api_client = cluster_config.get_api_client()
@@ -135,3 +404,103 @@ async def test_configure_client(config_file):
     context_dict = list_kube_config_contexts(config_file=str(config_file))
     current_context = context_dict[1]["name"]
     assert cluster_config.context_name == current_context
+
+
+async def test_configure_client_skips_active_config(config_file, monkeypatch):
+    monkeypatch.setattr(KubernetesClusterConfig, "_active_fingerprint", None)
+    load_kube_config_from_dict = MagicMock()
+    monkeypatch.setattr(
+        "prefect_kubernetes.credentials.config.kube_config.load_kube_config_from_dict",
+        load_kube_config_from_dict,
+    )
+    cluster_config = KubernetesClusterConfig.from_file(path=config_file)
+
+    cluster_config.configure_client()
+    cluster_config.configure_client()
+    load_kube_config_from_dict.assert_called_once()
+
+    KubernetesClusterConfig(
+        config=cluster_config.config, context_name="other-context"
+    ).configure_client()
+    assert load_kube_config_from_dict.call_count == 2
+
+
+async def test_configure_client_reloads_replaced_default(monkeypatch):
+    monkeypatch.setattr(KubernetesClusterConfig, "_active_fingerprint", None)
+    monkeypatch.setattr(Configuration, "_default", Configuration._default)
+    config_dict = yaml.safe_load(CONFIG_CONTENT)
+    config_dict["clusters"].append(
+        {"cluster": {"server": "https://other.internal:6443"}, "name": "other"}
+    )
+    config_dict["contexts"].append(
+        {"context": {"cluster": "other", "user": "docker-desktop"}, "name": "other"}
+    )
+    cluster_config = KubernetesClusterConfig(
+        config=config_dict, context_name="docker-desktop"
+    )
+    load_kube_config_from_dict = config.kube_config.load_kube_config_from_dict
+    spy = MagicMock(wraps=load_kube_config_from_dict)
+    monkeypatch.setattr(
+        "prefect_kubernetes.credentials.config.kube_config.load_kube_config_from_dict",
+        spy,
+    )
+
+    cluster_config.configure_client()
+    load_kube_config_from_dict(config_dict=config_dict, context="other")
+    assert Configuration.get_default_copy().host == "https://other.internal:6443"
+
+    cluster_config.configure_client()
+    assert spy.call_count == 2
+    assert (
+        Configuration.get_default_copy().host
+        == "https://kubernetes.docker.internal:6443"
+    )
+
+
+def test_configure_client_records_the_config_it_installed(monkeypatch):
+    monkeypatch.setattr(KubernetesClusterConfig, "_active_fingerprint", None)
+    monkeypatch.setattr(Configuration, "_default", Configuration._default)
+    config_dict = yaml.safe_load(CONFIG_CONTENT)
+    config_dict["contexts"].append(
+        {
+            "context": {"cluster": "docker-desktop", "user": "docker-desktop"},
+            "name": "other",
+        }
+    )
+    first = KubernetesClusterConfig(config=config_dict, context_name="docker-desktop")
+    second = KubernetesClusterConfig(config=config_dict, context_name="other")
+
+    load_kube_config_from_dict = config.kube_config.load_kube_config_from_dict
+    first_loaded = threading.Event()
+    second_loaded = threading.Event()
+    release_first = threading.Event()
+
+    def load_and_pause(**kwargs):
+        load_kube_config_from_dict(**kwargs)
+        if kwargs["context"] == "docker-desktop":
+            first_loaded.set()
+            release_first.wait(timeout=5)
+        else:
+            second_loaded.set()
+
+    monkeypatch.setattr(
+        "prefect_kubernetes.credentials.config.kube_config.load_kube_config_from_dict",
+        load_and_pause,
+    )
+
+    # Let the second activation run while the first is between loading its
+    # config and recording it as active
+    first_thread = threading.Thread(target=first.configure_client)
+    first_thread.start()
+    first_loaded.wait(timeout=5)
+    second_thread = threading.Thread(target=second.configure_client)
+    second_thread.start()
+    second_loaded.wait(timeout=1)
+    release_first.set()
+    first_thread.join()
+    second_thread.join()
+
+    assert KubernetesClusterConfig._active_default is Configuration._default
+    assert KubernetesClusterConfig._active_fingerprint == _fingerprint(
+        config_dict, "other"
+    )